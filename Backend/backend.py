@@ -1,22 +1,36 @@
 from fastapi import FastAPI, File, UploadFile, HTTPException, Form
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, ValidationError, field_validator
+from typing import List, Optional, Dict, Any, Tuple
 import os
-import requests
-import PyPDF2
-from io import BytesIO
+import shutil
+import subprocess
+import httpx
+import pymupdf
 from openai import OpenAI
 from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_openai import OpenAIEmbeddings
 from langchain_community.vectorstores import FAISS
+import faiss
+import redis
+import redis.asyncio
+import ahocorasick
 from langchain_openai import OpenAI as LangChainOpenAI
 from langchain.chains import RetrievalQA
-from langchain.schema import Document
-import json
+from langchain_core.embeddings import Embeddings
+from collections import OrderedDict
+import copy
+import hashlib
+import sqlite3
+import threading
+import orjson
 import re
+import time
+import asyncio
+import anyio.to_thread
+import numpy as np
 from datetime import datetime
 import logging
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 
 # Configure logging
@@ -26,10 +40,24 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+# Built per worker process in lifespan()
+resume_parser: Optional["ResumeParser"] = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create per-worker state on startup and release it on shutdown"""
+    global resume_parser
+    # Size the threadpool used to offload blocking work from the event loop
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    resume_parser = ResumeParser()
+    yield
+    await resume_parser.aclose()
+
 app = FastAPI(
     title="Resume Parser & Job Matcher API",
     description="Upload resumes and find matching remote jobs",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -42,6 +70,31 @@ app.add_middleware(
 )
 
 # Configuration
+# Worker threads available for blocking PDF/OpenAI/HTTP calls
+THREADPOOL_SIZE = int(os.getenv('THREADPOOL_SIZE', '64'))
+REMOTEOK_API_URL = "https://remoteok.io/api"
+REMOTEOK_CACHE_TTL = int(os.getenv('REMOTEOK_CACHE_TTL', '300'))  # seconds
+MAX_PDF_BYTES = int(os.getenv('MAX_PDF_BYTES', str(10 * 1024 * 1024)))
+PDF_MAX_PAGES = int(os.getenv('PDF_MAX_PAGES', '10'))  # 0 extracts every page
+LLM_MAX_RESUME_CHARS = 6000  # roughly the first 3-4 pages, where the relevant info lives
+DESCRIPTION_MATCH_CHARS = 500  # matches the description excerpt returned to clients
+RESUME_PARSER_MODEL = os.getenv('RESUME_PARSER_MODEL', 'gpt-4o-mini')
+RESUME_PARSER_MAX_TOKENS = 600
+EMBEDDING_MODEL = os.getenv('EMBEDDING_MODEL', 'text-embedding-3-small')
+EMBEDDING_BATCH_SIZE = 2048  # max inputs per OpenAI embeddings request
+CACHE_MAX_ENTRIES = int(os.getenv('CACHE_MAX_ENTRIES', '1000'))
+EMBEDDING_CACHE_DB = os.getenv('EMBEDDING_CACHE_DB')  # optional sqlite file for persisted embeddings
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv('SEMANTIC_CACHE_THRESHOLD', '0.97'))  # cosine similarity
+SEMANTIC_CACHE_TTL = int(os.getenv('SEMANTIC_CACHE_TTL', '86400'))  # seconds
+# Build a FAISS store of each uploaded resume; nothing consumes it yet, so off by default
+BUILD_RESUME_VECTOR_STORE = os.getenv('BUILD_RESUME_VECTOR_STORE', 'false').lower() == 'true'
+SEMANTIC_CACHE_PREFIX_CHARS = 2048  # leading resume text embedded for the semantic cache
+# Optional Redis cache shared by all workers; in-process caches only when unset
+REDIS_URL = os.getenv('REDIS_URL')
+REDIS_CACHE_TTL = int(os.getenv('REDIS_CACHE_TTL', '86400'))  # seconds, for resume info and embeddings
+# Fail fast on an unreachable Redis so a lookup degrades to a cache miss instead of hanging
+REDIS_TIMEOUT = float(os.getenv('REDIS_TIMEOUT', '0.5'))  # seconds
+REMOTEOK_FEED_KEY = "remoteok:feed"
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
 if not OPENAI_API_KEY:
     print("Warning: OPENAI_API_KEY environment variable is not set")
@@ -50,6 +103,30 @@ if not OPENAI_API_KEY:
     print("Linux/Mac: export OPENAI_API_KEY='your-api-key-here'")
     print("The application will start but OpenAI features will be limited.")
 
+# Keywords for the fallback (non-OpenAI) resume parser
+# Common programming languages and technologies
+TECH_KEYWORDS = [
+    'python', 'javascript', 'java', 'react', 'node.js', 'sql', 'html', 'css',
+    'mongodb', 'postgresql', 'mysql', 'docker', 'kubernetes', 'aws', 'azure',
+    'git', 'linux', 'typescript', 'angular', 'vue', 'php', 'ruby', 'go',
+    'c++', 'c#', '.net', 'spring', 'django', 'flask', 'express', 'laravel'
+]
+# Basic job titles
+JOB_TITLE_KEYWORDS = [
+    'developer', 'engineer', 'programmer', 'analyst', 'manager', 'lead',
+    'senior', 'junior', 'architect', 'consultant', 'specialist', 'coordinator'
+]
+
+def build_keyword_automaton(keywords: List[str]) -> ahocorasick.Automaton:
+    """Build an Aho-Corasick automaton that reports each keyword it finds"""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+FALLBACK_KEYWORD_AUTOMATON = build_keyword_automaton(TECH_KEYWORDS + JOB_TITLE_KEYWORDS)
+
 # Pydantic models
 class JobSearchRequest(BaseModel):
     skills: Optional[List[str]] = []
@@ -78,14 +155,24 @@ class JobInfo(BaseModel):
     matched_keywords: List[str]
 
 class ResumeInfo(BaseModel):
-    skills: List[str]
-    experience: List[str]
-    education: List[str]
-    technologies: List[str]
-    job_titles: List[str]
-    industries: List[str]
-    years_of_experience: str
-    preferred_roles: List[str]
+    # Filled from LLM output, so tolerate missing/null fields and numeric years
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+    
+    skills: List[str] = []
+    experience: List[str] = []
+    education: List[str] = []
+    technologies: List[str] = []
+    job_titles: List[str] = []
+    industries: List[str] = []
+    years_of_experience: str = "Not determined"
+    preferred_roles: List[str] = []
+    
+    @field_validator('*', mode='before')
+    @classmethod
+    def replace_null(cls, value, info):
+        if value is None:
+            return cls.model_fields[info.field_name].get_default(call_default_factory=True)
+        return value
 
 class ParseResumeResponse(BaseModel):
     success: bool
@@ -94,26 +181,291 @@ class ParseResumeResponse(BaseModel):
     jobs: List[JobInfo]
     message: str
 
+class SearchJobsResponse(BaseModel):
+    success: bool
+    jobs_found: int
+    jobs: List[JobInfo]
+    search_criteria: Dict[str, Any]
+
+class AnalyzeResumeResponse(BaseModel):
+    success: bool
+    resume_info: ResumeInfo
+
+def content_hash(text: str) -> str:
+    """SHA-256 hex digest used as a cache key for text content"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+class LRUCache:
+    """Small thread-safe LRU cache"""
+    def __init__(self, maxsize: int = CACHE_MAX_ENTRIES):
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+    
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+class OpenAIBatchEmbeddings(Embeddings):
+    """Embeds a list of texts with as few OpenAI embeddings requests as possible"""
+    def __init__(self, client: OpenAI, model: str = EMBEDDING_MODEL):
+        self.client = client
+        self.model = model
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        vectors = []
+        for start in range(0, len(texts), EMBEDDING_BATCH_SIZE):
+            response = self.client.embeddings.create(
+                model=self.model,
+                input=texts[start:start + EMBEDDING_BATCH_SIZE]
+            )
+            vectors.extend(item.embedding for item in sorted(response.data, key=lambda item: item.index))
+        return vectors
+    
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper that only sends texts without a cached vector to the underlying model"""
+    def __init__(self, underlying: Embeddings, maxsize: int = CACHE_MAX_ENTRIES, db_path: Optional[str] = EMBEDDING_CACHE_DB,
+                 redis_client: Optional[redis.Redis] = None):
+        self.underlying = underlying
+        self.redis = redis_client
+        self.namespace = getattr(underlying, 'model', type(underlying).__name__)
+        self._memory = LRUCache(maxsize)
+        self._db = None
+        self._db_lock = threading.Lock()
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB)")
+            self._db.commit()
+    
+    def _key(self, text: str) -> str:
+        return f"{self.namespace}:{content_hash(text)}"
+    
+    def _lookup(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Cached vectors for the given keys: memory first, then one Redis and one sqlite round-trip"""
+        found = {}
+        for key in keys:
+            vector = self._memory.get(key)
+            if vector is not None:
+                found[key] = vector
+        missing = [key for key in keys if key not in found]
+        
+        if missing and self.redis:
+            try:
+                packed_vectors = self.redis.mget([f"emb:{key}" for key in missing])
+            except redis.RedisError as e:
+                logger.warning(f"Redis embedding lookup failed: {str(e)}")
+                packed_vectors = [None] * len(missing)
+            for key, packed in zip(missing, packed_vectors):
+                if packed is not None:
+                    found[key] = np.frombuffer(packed, dtype=np.float16).astype(np.float32).tolist()
+                    self._memory.set(key, found[key])
+            missing = [key for key in missing if key not in found]
+        
+        if missing and self._db:
+            placeholders = ",".join("?" * len(missing))
+            with self._db_lock:
+                rows = self._db.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", missing
+                ).fetchall()
+            for key, blob in rows:
+                found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+                self._memory.set(key, found[key])
+        return found
+    
+    def _store(self, vectors: Dict[str, List[float]]):
+        """Write new vectors to every cache layer, batching the Redis and sqlite writes"""
+        for key, vector in vectors.items():
+            self._memory.set(key, vector)
+        if self.redis:
+            # float16 halves the shared cache size; precision is ample for similarity search
+            try:
+                with self.redis.pipeline(transaction=False) as pipe:
+                    for key, vector in vectors.items():
+                        pipe.set(f"emb:{key}", np.asarray(vector, dtype=np.float16).tobytes(), ex=REDIS_CACHE_TTL)
+                    pipe.execute()
+            except redis.RedisError as e:
+                logger.warning(f"Redis embedding store failed: {str(e)}")
+        if self._db:
+            with self._db_lock:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(key, np.asarray(vector, dtype=np.float32).tobytes()) for key, vector in vectors.items()]
+                )
+                self._db.commit()
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [self._key(text) for text in texts]
+        vectors = self._lookup(list(dict.fromkeys(keys)))
+        
+        # Embed each distinct uncached text once
+        uncached = {}
+        for key, text in zip(keys, texts):
+            if key not in vectors:
+                uncached.setdefault(key, text)
+        if uncached:
+            new_vectors = dict(zip(uncached, self.underlying.embed_documents(list(uncached.values()))))
+            self._store(new_vectors)
+            vectors.update(new_vectors)
+        return [vectors[key] for key in keys]
+    
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+class SemanticResumeCache:
+    """Returns previously parsed resume info for near-duplicate resume texts"""
+    def __init__(self, embeddings: Embeddings, threshold: float = SEMANTIC_CACHE_THRESHOLD,
+                 ttl: int = SEMANTIC_CACHE_TTL, maxsize: int = CACHE_MAX_ENTRIES):
+        self.embeddings = embeddings
+        self.threshold = threshold
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._index = None  # built lazily once the embedding size is known
+        self._entries: OrderedDict = OrderedDict()  # id -> (namespace, created_at, resume_info)
+        self._next_id = 0
+        self._lock = threading.Lock()
+    
+    def embed(self, text: str) -> np.ndarray:
+        """Normalized embedding of the leading part of the resume text"""
+        vector = np.asarray(self.embeddings.embed_query(text[:SEMANTIC_CACHE_PREFIX_CHARS]), dtype=np.float32)
+        vector = vector.reshape(1, -1)
+        faiss.normalize_L2(vector)
+        return vector
+    
+    def _remove(self, ids: List[int]):
+        self._index.remove_ids(np.asarray(ids, dtype=np.int64))
+        for entry_id in ids:
+            self._entries.pop(entry_id, None)
+    
+    def lookup(self, vector: np.ndarray, namespace: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if self._index is None or self._index.ntotal == 0:
+                return None
+            scores, ids = self._index.search(vector, 1)
+            score, entry_id = float(scores[0][0]), int(ids[0][0])
+            if entry_id < 0 or score < self.threshold:
+                return None
+            entry_namespace, created_at, resume_info = self._entries[entry_id]
+            if time.monotonic() - created_at > self.ttl:
+                self._remove([entry_id])
+                return None
+            if entry_namespace != namespace:
+                return None
+            return copy.deepcopy(resume_info)
+    
+    def add(self, vector: np.ndarray, namespace: str, resume_info: Dict[str, Any]):
+        with self._lock:
+            if self._index is None:
+                self._index = faiss.IndexIDMap(faiss.IndexFlatIP(vector.shape[1]))
+            entry_id = self._next_id
+            self._next_id += 1
+            self._index.add_with_ids(vector, np.asarray([entry_id], dtype=np.int64))
+            self._entries[entry_id] = (namespace, time.monotonic(), copy.deepcopy(resume_info))
+            if len(self._entries) > self.maxsize:
+                self._remove(list(self._entries)[:len(self._entries) - self.maxsize])
+
 class ResumeParser:
     def __init__(self):
+        # Shared cross-worker cache: sync client for threadpool code, async client for coroutines
+        if REDIS_URL:
+            redis_options = {'socket_connect_timeout': REDIS_TIMEOUT, 'socket_timeout': REDIS_TIMEOUT}
+            self.redis = redis.Redis.from_url(REDIS_URL, **redis_options)
+            self.async_redis = redis.asyncio.Redis.from_url(REDIS_URL, **redis_options)
+        else:
+            self.redis = None
+            self.async_redis = None
+        
         if not OPENAI_API_KEY:
             logger.warning("OpenAI API key not available. AI features will be limited.")
             self.embeddings = None
             self.llm = None
             self.openai_client = None
+            self.openai_http_client = None
         else:
-            self.embeddings = OpenAIEmbeddings(api_key=OPENAI_API_KEY)
-            self.llm = LangChainOpenAI(temperature=0, api_key=OPENAI_API_KEY)
-            self.openai_client = OpenAI(api_key=OPENAI_API_KEY)
+            # One pooled HTTP/2 client shared by every OpenAI call so connections are reused
+            self.openai_http_client = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                timeout=30
+            )
+            self.openai_client = OpenAI(api_key=OPENAI_API_KEY, http_client=self.openai_http_client)
+            self.embeddings = CachedEmbeddings(OpenAIBatchEmbeddings(self.openai_client), redis_client=self.redis)
+            self.llm = LangChainOpenAI(temperature=0, api_key=OPENAI_API_KEY, http_client=self.openai_http_client)
+        
+        # Prefer poppler's pdftotext when installed; looked up once per parser
+        self.pdftotext_path = shutil.which("pdftotext")
+        
+        # Shared HTTP client so RemoteOK requests reuse pooled connections
+        self.http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=30,
+            follow_redirects=True,  # as requests did; remoteok.io redirects to remoteok.com
+            headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+        )
         
-    def extract_text_from_pdf(self, pdf_file: bytes) -> str:
-        """Extract text from PDF file"""
+        # RemoteOK feed cache: (fetched_at, jobs); the lock coalesces concurrent misses
+        self._jobs_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        self._jobs_cache_lock = asyncio.Lock()
+        
+        # Parsed resume info keyed by (model, sha256 of resume text)
+        self._resume_info_cache = LRUCache()
+        # Near-duplicate resumes (formatting/whitespace edits) that miss the exact cache
+        self._semantic_cache = SemanticResumeCache(self.embeddings) if self.embeddings else None
+        
+    async def aclose(self):
+        """Close pooled HTTP and Redis connections"""
+        await self.http_client.aclose()
+        if self.openai_http_client:
+            self.openai_http_client.close()
+        if self.redis:
+            self.redis.close()
+            await self.async_redis.aclose()
+    
+    def extract_text_with_pdftotext(self, pdf_file: bytes, max_pages: int = PDF_MAX_PAGES) -> Optional[str]:
+        """Extract text using the pdftotext binary, or None if it is unavailable or fails"""
+        if not self.pdftotext_path:
+            return None
+        command = [self.pdftotext_path, "-layout"]
+        if max_pages:
+            command += ["-l", str(max_pages)]
         try:
-            pdf_reader = PyPDF2.PdfReader(BytesIO(pdf_file))
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
+            result = subprocess.run(
+                command + ["-", "-"],
+                input=pdf_file,
+                capture_output=True,
+                timeout=30
+            )
+        except (subprocess.TimeoutExpired, OSError) as e:
+            logger.warning(f"pdftotext failed, falling back to PyMuPDF: {str(e)}")
+            return None
+        if result.returncode != 0:
+            logger.warning(f"pdftotext exited with code {result.returncode}, falling back to PyMuPDF")
+            return None
+        return result.stdout.decode("utf-8", errors="replace")
+    
+    def extract_text_from_pdf(self, pdf_file: bytes, max_pages: int = PDF_MAX_PAGES) -> str:
+        """Extract text from the first max_pages pages of a PDF file (all pages if 0)"""
+        text = self.extract_text_with_pdftotext(pdf_file, max_pages)
+        if text is not None:
             return text
+        try:
+            with pymupdf.open(stream=pdf_file, filetype="pdf") as doc:
+                if max_pages and doc.page_count > max_pages:
+                    logger.info(f"PDF has {doc.page_count} pages, extracting the first {max_pages}")
+                pages = doc.pages(0, min(max_pages, doc.page_count)) if max_pages else doc
+                return "\n".join(page.get_text("text") for page in pages)
         except Exception as e:
             logger.error(f"Error extracting text from PDF: {str(e)}")
             raise HTTPException(status_code=400, detail=f"Error extracting text from PDF: {str(e)}")
@@ -133,10 +485,12 @@ class ResumeParser:
             )
             
             chunks = text_splitter.split_text(text)
-            documents = [Document(page_content=chunk) for chunk in chunks]
+            if not chunks:
+                return None
             
-            # Create vector store
-            vector_store = FAISS.from_documents(documents, self.embeddings)
+            # Embed all chunks in one batched request, then build the index from the vectors
+            vectors = self.embeddings.embed_documents(chunks)
+            vector_store = FAISS.from_embeddings(list(zip(chunks, vectors)), embedding=self.embeddings)
             return vector_store
         except Exception as e:
             logger.error(f"Error creating vector store: {str(e)}")
@@ -149,11 +503,54 @@ class ResumeParser:
                 logger.warning("OpenAI API key not available. Using fallback parsing.")
                 return self.fallback_resume_parsing(text)
             
+            # Only the leading part of long resumes is sent to the model, which keeps
+            # prompt size (and latency) bounded; the caches are keyed on what is sent
+            text_for_llm = text[:LLM_MAX_RESUME_CHARS]
+            if len(text) > LLM_MAX_RESUME_CHARS:
+                logger.info(f"Truncated resume text from {len(text)} to {LLM_MAX_RESUME_CHARS} characters")
+            
+            cache_key = (RESUME_PARSER_MODEL, content_hash(text_for_llm))
+            cached = self._resume_info_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Using cached resume info")
+                return copy.deepcopy(cached)
+            
+            redis_key = f"resume:{RESUME_PARSER_MODEL}:sha256:{cache_key[1]}"
+            if self.redis:
+                try:
+                    packed = self.redis.get(redis_key)
+                except redis.RedisError as e:
+                    logger.warning(f"Redis resume info lookup failed: {str(e)}")
+                    packed = None
+                if packed is not None:
+                    try:
+                        # Entries written before validation was added may be malformed
+                        resume_info = ResumeInfo.model_validate(orjson.loads(packed)).model_dump()
+                    except (ValidationError, orjson.JSONDecodeError) as e:
+                        logger.warning(f"Ignoring malformed Redis-cached resume info: {str(e)}")
+                    else:
+                        logger.info("Using Redis-cached resume info")
+                        self._resume_info_cache.set(cache_key, copy.deepcopy(resume_info))
+                        return resume_info
+            
+            semantic_vector = None
+            if self._semantic_cache:
+                try:
+                    semantic_vector = self._semantic_cache.embed(text_for_llm)
+                    cached = self._semantic_cache.lookup(semantic_vector, RESUME_PARSER_MODEL)
+                except Exception as e:
+                    logger.warning(f"Semantic cache lookup failed: {str(e)}")
+                    cached = None
+                if cached is not None:
+                    logger.info("Using semantically cached resume info")
+                    self._resume_info_cache.set(cache_key, copy.deepcopy(cached))
+                    return cached
+            
             prompt = f"""
             Analyze the following resume text and extract key information in JSON format:
             
             Resume Text:
-            {text}
+            {text_for_llm}
             
             Please extract and return a JSON object with the following structure:
             {{
@@ -171,24 +568,41 @@ class ResumeParser:
             """
             
             response = self.openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
+                model=RESUME_PARSER_MODEL,
                 messages=[
-                    {"role": "system", "content": "You are an expert resume parser. Extract information accurately and return valid JSON."},
+                    {"role": "system", "content": "You are an expert resume parser. Extract information accurately and respond only with a valid JSON object."},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=0
+                temperature=0,
+                max_tokens=RESUME_PARSER_MAX_TOKENS,
+                response_format={"type": "json_object"}
             )
             
-            result = response.choices[0].message.content
-            
-            # Clean and parse JSON
-            result = result.strip()
-            if result.startswith('```json'):
-                result = result[7:-3]
-            elif result.startswith('```'):
-                result = result[3:-3]
+            choice = response.choices[0]
+            if choice.finish_reason == "length":
+                # The reply hit RESUME_PARSER_MAX_TOKENS, so the JSON is cut off
+                logger.warning(
+                    f"Resume info response truncated at max_tokens={RESUME_PARSER_MAX_TOKENS}; "
+                    "falling back to basic parsing"
+                )
+                return self.fallback_resume_parsing(text)
             
-            return json.loads(result)
+            # JSON mode guarantees a bare JSON object, no code fences, but not its shape;
+            # validate before caching so a malformed reply is never reused
+            try:
+                resume_info = ResumeInfo.model_validate(orjson.loads(choice.message.content)).model_dump()
+            except ValidationError as e:
+                logger.warning(f"Resume info response has an unexpected shape, falling back to basic parsing: {str(e)}")
+                return self.fallback_resume_parsing(text)
+            self._resume_info_cache.set(cache_key, copy.deepcopy(resume_info))
+            if self.redis:
+                try:
+                    self.redis.set(redis_key, orjson.dumps(resume_info), ex=REDIS_CACHE_TTL)
+                except redis.RedisError as e:
+                    logger.warning(f"Redis resume info store failed: {str(e)}")
+            if semantic_vector is not None:
+                self._semantic_cache.add(semantic_vector, RESUME_PARSER_MODEL, resume_info)
+            return resume_info
             
         except Exception as e:
             logger.error(f"Error extracting resume info: {str(e)}")
@@ -201,24 +615,10 @@ class ResumeParser:
             # Basic keyword extraction
             text_lower = text.lower()
             
-            # Common programming languages and technologies
-            tech_keywords = [
-                'python', 'javascript', 'java', 'react', 'node.js', 'sql', 'html', 'css',
-                'mongodb', 'postgresql', 'mysql', 'docker', 'kubernetes', 'aws', 'azure',
-                'git', 'linux', 'typescript', 'angular', 'vue', 'php', 'ruby', 'go',
-                'c++', 'c#', '.net', 'spring', 'django', 'flask', 'express', 'laravel'
-            ]
-            
-            # Extract technologies found in resume
-            found_technologies = [tech for tech in tech_keywords if tech in text_lower]
-            
-            # Basic job titles extraction
-            job_title_keywords = [
-                'developer', 'engineer', 'programmer', 'analyst', 'manager', 'lead',
-                'senior', 'junior', 'architect', 'consultant', 'specialist', 'coordinator'
-            ]
-            
-            found_job_titles = [title for title in job_title_keywords if title in text_lower]
+            # Single pass over the text reports every technology and job title it contains
+            found = {keyword for _, keyword in FALLBACK_KEYWORD_AUTOMATON.iter(text_lower)}
+            found_technologies = [tech for tech in TECH_KEYWORDS if tech in found]
+            found_job_titles = [title for title in JOB_TITLE_KEYWORDS if title in found]
             
             return {
                 "skills": found_technologies[:10],  # Limit results
@@ -244,26 +644,52 @@ class ResumeParser:
                 "preferred_roles": []
             }
     
-    def search_jobs_on_remoteok(self, resume_info: Dict[str, Any], limit: int = 20) -> List[Dict[str, Any]]:
-        """Search for relevant jobs on RemoteOK based on resume information"""
-        try:
-            # Get job listings from RemoteOK API
-            url = "https://remoteok.io/api"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
+    async def fetch_remoteok_jobs(self) -> List[Dict[str, Any]]:
+        """Fetch job listings from RemoteOK, reusing a cached copy for REMOTEOK_CACHE_TTL seconds"""
+        async with self._jobs_cache_lock:
+            if self._jobs_cache and time.monotonic() - self._jobs_cache[0] < REMOTEOK_CACHE_TTL:
+                return self._jobs_cache[1]
+            
+            # Another worker may already have fetched the feed
+            if self.async_redis:
+                try:
+                    async with self.async_redis.pipeline(transaction=False) as pipe:
+                        packed, remaining = await pipe.get(REMOTEOK_FEED_KEY).ttl(REMOTEOK_FEED_KEY).execute()
+                except redis.RedisError as e:
+                    logger.warning(f"Redis feed lookup failed: {str(e)}")
+                    packed = None
+                if packed is not None:
+                    jobs_data = orjson.loads(packed)
+                    # Expire locally when the shared copy does
+                    age = REMOTEOK_CACHE_TTL - max(remaining, 0)
+                    self._jobs_cache = (time.monotonic() - age, jobs_data)
+                    return jobs_data
             
-            response = requests.get(url, headers=headers, timeout=30)
+            response = await self.http_client.get(REMOTEOK_API_URL)
             if response.status_code != 200:
                 logger.error(f"Failed to fetch jobs from RemoteOK: {response.status_code}")
                 return []
             
-            jobs_data = response.json()
+            jobs_data = orjson.loads(response.content)
             
             # Filter out the first item (metadata)
             if jobs_data and isinstance(jobs_data[0], dict) and 'legal' in jobs_data[0]:
                 jobs_data = jobs_data[1:]
             
+            self._jobs_cache = (time.monotonic(), jobs_data)
+            if self.async_redis:
+                try:
+                    await self.async_redis.set(REMOTEOK_FEED_KEY, orjson.dumps(jobs_data), ex=REMOTEOK_CACHE_TTL)
+                except redis.RedisError as e:
+                    logger.warning(f"Redis feed store failed: {str(e)}")
+            return jobs_data
+    
+    async def search_jobs_on_remoteok(self, resume_info: Dict[str, Any], limit: int = 20) -> List[Dict[str, Any]]:
+        """Search for relevant jobs on RemoteOK based on resume information"""
+        try:
+            # Get job listings from RemoteOK API
+            jobs_data = await self.fetch_remoteok_jobs()
+            
             # Extract relevant keywords from resume
             keywords = []
             if 'skills' in resume_info:
@@ -273,56 +699,74 @@ class ResumeParser:
             if 'job_titles' in resume_info:
                 keywords.extend([title.lower() for title in resume_info['job_titles']])
             
-            # Score and filter jobs
-            relevant_jobs = []
+            # Drop duplicates and blanks once, then limit keywords for performance
+            keywords = [keyword for keyword in dict.fromkeys(keywords) if keyword][:20]
+            if not keywords:
+                return []
+            keyword_set = set(keywords)
+            
+            # One alternation regex scans each field once instead of once per keyword.
+            # Lookarounds rather than \b so keywords like "c++" and ".net" still match;
+            # longest first so "node.js" wins over "node".
+            alternation = "|".join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True))
+            keyword_pattern = re.compile(r"(?<!\w)(" + alternation + r")(?!\w)")
+            
+            # Score and filter jobs, kept as parallel lists indexed by match
+            scores: List[int] = []
+            matched_lists: List[List[str]] = []
+            matched_jobs: List[Dict[str, Any]] = []
             
             for job in jobs_data[:100]:  # Limit initial processing
                 if not isinstance(job, dict):
                     continue
-                    
-                job_title = job.get('position', '').lower()
-                job_description = job.get('description', '').lower()
-                job_tags = [tag.lower() for tag in job.get('tags', [])]
                 
-                # Calculate relevance score
-                score = 0
-                matched_keywords = []
+                # Lowercase each field once; only the description prefix that ends up
+                # in the response is searched
+                job_title = (job.get('position') or '').lower()
+                job_description = (job.get('description') or '')[:DESCRIPTION_MATCH_CHARS].lower()
+                job_tags = {tag.lower() for tag in job.get('tags') or []}
                 
-                for keyword in keywords[:20]:  # Limit keywords for performance
-                    if keyword in job_title:
-                        score += 3
-                        matched_keywords.append(keyword)
-                    elif keyword in job_tags:
-                        score += 2
-                        matched_keywords.append(keyword)
-                    elif keyword in job_description:
-                        score += 1
-                        matched_keywords.append(keyword)
+                # Each keyword counts once, for the highest-weighted field it appears in
+                matched = set(keyword_pattern.findall(job_title))
+                score = 3 * len(matched)
+                tag_hits = (keyword_set & job_tags) - matched
+                score += 2 * len(tag_hits)
+                matched |= tag_hits
+                description_hits = set(keyword_pattern.findall(job_description)) - matched
+                score += len(description_hits)
+                matched |= description_hits
                 
                 if score > 0:
-                    relevant_jobs.append({
-                        'score': score,
-                        'matched_keywords': list(set(matched_keywords)),
-                        'job': job
-                    })
+                    scores.append(score)
+                    matched_lists.append(list(matched))
+                    matched_jobs.append(job)
             
-            # Sort by relevance score and return top jobs
-            relevant_jobs.sort(key=lambda x: x['score'], reverse=True)
+            if not scores or limit <= 0:
+                return []
+            
+            # Top-k selection in O(N). The key is unique per job (score descending, then
+            # feed position), so tied jobs are picked and ordered in feed order.
+            scores_arr = np.fromiter(scores, dtype=np.int32, count=len(scores))
+            n = len(scores_arr)
+            k = min(limit, n)
+            rank_key = -scores_arr.astype(np.int64) * n + np.arange(n)
+            top = np.argpartition(rank_key, k - 1)[:k]
+            top = top[np.argsort(rank_key[top])]
             
             formatted_jobs = []
-            for item in relevant_jobs[:limit]:
-                job = item['job']
+            for index in top:
+                job = matched_jobs[index]
                 formatted_job = {
-                    'position': job.get('position', 'N/A'),
-                    'company': job.get('company', 'N/A'),
+                    'position': job.get('position') or 'N/A',
+                    'company': job.get('company') or 'N/A',
                     'salary': self.format_salary(job.get('salary_min'), job.get('salary_max')),
-                    'location': job.get('location', 'Remote'),
-                    'tags': job.get('tags', []),
-                    'apply_url': job.get('apply_url', f"https://remoteok.io/remote-jobs/{job.get('id', '')}"),
-                    'date_posted': job.get('date', ''),
-                    'description': job.get('description', '')[:500] + '...' if job.get('description', '') else 'N/A',
-                    'relevance_score': item['score'],
-                    'matched_keywords': item['matched_keywords']
+                    'location': job.get('location') or 'Remote',
+                    'tags': job.get('tags') or [],
+                    'apply_url': job.get('apply_url') or f"https://remoteok.io/remote-jobs/{job.get('id', '')}",
+                    'date_posted': job.get('date') or '',
+                    'description': job['description'][:DESCRIPTION_MATCH_CHARS] + '...' if job.get('description') else 'N/A',
+                    'relevance_score': int(scores_arr[index]),
+                    'matched_keywords': matched_lists[index]
                 }
                 formatted_jobs.append(formatted_job)
             
@@ -343,9 +787,6 @@ class ResumeParser:
         else:
             return "Not specified"
 
-# Initialize parser
-resume_parser = ResumeParser()
-
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint"""
@@ -354,7 +795,7 @@ async def health_check():
         timestamp=datetime.now().isoformat()
     )
 
-@app.post("/parse-resume")
+@app.post("/parse-resume", response_model=ParseResumeResponse)
 async def parse_resume(
     resume: UploadFile = File(...),
     job_limit: int = Form(20)
@@ -365,27 +806,35 @@ async def parse_resume(
         if not resume.filename.lower().endswith('.pdf'):
             raise HTTPException(status_code=400, detail="Only PDF files are supported")
         
-        # Read file content
-        file_content = await resume.read()
+        # Reject oversized uploads before reading them into memory
+        too_large_detail = f"PDF exceeds the {MAX_PDF_BYTES} byte size limit"
+        if resume.size is not None and resume.size > MAX_PDF_BYTES:
+            raise HTTPException(status_code=413, detail=too_large_detail)
+        
+        # Read file content, never more than the limit (size may be unknown)
+        file_content = await resume.read(MAX_PDF_BYTES + 1)
+        if len(file_content) > MAX_PDF_BYTES:
+            raise HTTPException(status_code=413, detail=too_large_detail)
         
         # Extract text from PDF
         logger.info("Extracting text from PDF...")
-        text = resume_parser.extract_text_from_pdf(file_content)
+        text = await anyio.to_thread.run_sync(resume_parser.extract_text_from_pdf, file_content)
         
         if not text.strip():
             raise HTTPException(status_code=400, detail="Could not extract text from PDF")
         
         # Create vector store for semantic search
-        logger.info("Creating vector store...")
-        vector_store = resume_parser.create_vector_store(text)
+        if BUILD_RESUME_VECTOR_STORE:
+            logger.info("Creating vector store...")
+            await anyio.to_thread.run_sync(resume_parser.create_vector_store, text)
         
         # Extract resume information
         logger.info("Extracting resume information...")
-        resume_info = resume_parser.extract_resume_info(text)
+        resume_info = await anyio.to_thread.run_sync(resume_parser.extract_resume_info, text)
         
         # Search for relevant jobs
         logger.info("Searching for relevant jobs...")
-        jobs = resume_parser.search_jobs_on_remoteok(resume_info, limit=job_limit)
+        jobs = await resume_parser.search_jobs_on_remoteok(resume_info, limit=job_limit)
         
         return {
             "success": True,
@@ -401,7 +850,7 @@ async def parse_resume(
         logger.error(f"Error in parse_resume: {str(e)}")
         raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
 
-@app.post("/search-jobs")
+@app.post("/search-jobs", response_model=SearchJobsResponse)
 async def search_jobs(request: JobSearchRequest):
     """Search jobs based on provided skills/criteria"""
     try:
@@ -413,7 +862,7 @@ async def search_jobs(request: JobSearchRequest):
             "industries": request.industries
         }
         
-        jobs = resume_parser.search_jobs_on_remoteok(resume_info, limit=request.limit)
+        jobs = await resume_parser.search_jobs_on_remoteok(resume_info, limit=request.limit)
         
         return {
             "success": True,
@@ -426,12 +875,12 @@ async def search_jobs(request: JobSearchRequest):
         logger.error(f"Error in search_jobs: {str(e)}")
         raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
 
-@app.post("/analyze-resume-text")
+@app.post("/analyze-resume-text", response_model=AnalyzeResumeResponse)
 async def analyze_resume_text(request: ResumeAnalysisRequest):
     """Analyze resume text directly (for testing)"""
     try:
         # Extract resume information
-        resume_info = resume_parser.extract_resume_info(request.text)
+        resume_info = await anyio.to_thread.run_sync(resume_parser.extract_resume_info, request.text)
         
         return {
             "success": True,
@@ -469,5 +918,7 @@ if __name__ == "__main__":
     print("  POST /analyze-resume-text - Analyze resume text directly")
     print("  GET /health - Health check")
     print("  GET /docs - Interactive API documentation")
+    print("For production, run multiple workers with Gunicorn:")
+    print("  gunicorn backend:app --chdir Backend -k uvicorn.workers.UvicornWorker -w 9 --bind 0.0.0.0:8000 --timeout 120")
     
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file